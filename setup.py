@@ -10,8 +10,12 @@ setup(
     install_requires=[
         "gradio>=4.0.0",
         "openai>=1.0.0",
-        "beautifulsoup4>=4.12.0",
+        "tiktoken>=0.5.0",
+        "lxml>=4.9.0",
+        "cssselect>=1.2.0",
         "requests>=2.31.0",
+        "requests-cache>=1.1.0",
+        "brotli>=1.0.9",
         "python-dotenv>=1.0.0",
     ],
     classifiers=[
@@ -2,7 +2,10 @@
 Gradioインターフェースを管理するモジュール
 """
 
-import re
+import string
+import time
+import asyncio
+import functools
 import logging
 import gradio as gr
 from typing import Tuple, Optional
@@ -12,6 +15,84 @@ from .post_generator import PostGenerator
 # ロガーの設定
 logger = logging.getLogger(__name__)
 
+# ストリーミング時に画面を更新する間隔（文字数・秒数のどちらかを超えたら更新）
+STREAM_YIELD_MIN_CHARS = 32
+STREAM_YIELD_INTERVAL = 0.1
+
+# ユーザー名として許可する文字（[a-zA-Z0-9_-]）を削除する変換テーブル
+_USERNAME_CHARS = string.ascii_letters + string.digits + "_-"
+_STRIP_USERNAME_CHARS = str.maketrans("", "", _USERNAME_CHARS)
+
+# ZennのURLのスキーム
+_URL_SCHEMES = ("https://", "http://")
+
+
+def _is_valid_username(name: str) -> bool:
+    """
+    ユーザー名が許可された文字のみで構成されているかを判定する
+
+    Args:
+        name: 判定するユーザー名
+
+    Returns:
+        bool: 空でなく、[a-zA-Z0-9_-]のみで構成されている場合はTrue
+    """
+    return bool(name) and not name.translate(_STRIP_USERNAME_CHARS)
+
+
+def _leading_username(text: str) -> str:
+    """
+    文字列の先頭からユーザー名として許可された文字が続く部分を取り出す
+
+    Args:
+        text: 対象の文字列
+
+    Returns:
+        str: 先頭のユーザー名部分（許可された文字で始まらない場合は空文字列）
+    """
+    return text[: len(text) - len(text.lstrip(_USERNAME_CHARS))]
+
+
+def _strip_final_newline(text: str) -> str:
+    """
+    末尾の改行を1つだけ取り除く（正規表現の$が末尾の改行の直前にも一致するのに合わせる）
+
+    Args:
+        text: 対象の文字列
+
+    Returns:
+        str: 末尾の改行を1つ取り除いた文字列
+    """
+    return text[:-1] if text.endswith("\n") else text
+
+
+def _search_zenn_url(url: str, path_prefix: str) -> Optional[str]:
+    """
+    文字列中のZennのURL（http(s)://<path_prefix><ユーザー名>[/...]）からユーザー名を取り出す
+
+    出現位置を先頭から順に調べ、最初に条件を満たしたURLのユーザー名を返す。
+    ユーザー名の後は文字列の終わりか、改行を含まない「/...」のみを許可する（末尾の改行1つは許容）。
+
+    Args:
+        url: 対象の文字列
+        path_prefix: スキームの後に続くパス（"zenn.dev/p/"または"zenn.dev/"）
+
+    Returns:
+        Optional[str]: 抽出されたユーザー名、見つからない場合はNone
+    """
+    start = url.find("http")
+    while start != -1:
+        for scheme in _URL_SCHEMES:
+            prefix = scheme + path_prefix
+            if url.startswith(prefix, start):
+                rest = url[start + len(prefix) :]
+                name = _leading_username(rest)
+                tail = _strip_final_newline(rest[len(name) :])
+                if name and (not tail or (tail[0] == "/" and "\n" not in tail)):
+                    return name
+        start = url.find("http", start + 1)
+    return None
+
 
 class GradioInterface:
     """Gradioインターフェースを管理するクラス"""
@@ -21,14 +102,17 @@ class GradioInterface:
         GradioInterfaceの初期化
 
         Args:
-            fetcher: ZennDataFetcherのインスタンス
-            generator: PostGeneratorのインスタンス
+            fetcher: ZennDataFetcherのインスタンス（Noneの場合は最初のリクエスト時に作成）
+            generator: PostGeneratorのインスタンス（Noneの場合は新規に作成）
         """
         self.fetcher = fetcher
-        self.generator = generator
+        self.generator = generator or PostGenerator()
         self.current_articles = []
 
-    def extract_username(self, url: str) -> Optional[str]:
+        # 構築済みのGradioインターフェース（初回起動時に構築）
+        self._interface = None
+
+    def extract_username(self, url: str) -> Optional[Tuple[str, bool]]:
         """
         ZennのURLからユーザー名を抽出する
 
@@ -36,27 +120,29 @@ class GradioInterface:
             url: ZennのURL
 
         Returns:
-            Optional[str]: 抽出されたユーザー名、抽出できない場合はNone
+            Optional[Tuple[str, bool]]: 抽出されたユーザー名と企業アカウントかどうか、抽出できない場合はNone
         """
-        # 企業アカウントのURLからユーザー名を抽出するパターン
-        company_pattern = r"https?://zenn\.dev/p/([a-zA-Z0-9_-]+)(?:/.*)?$"
-        match = re.search(company_pattern, url)
-        if match:
-            return match.group(1)  # 企業アカウントの場合は、p/の後のユーザー名を返す
-
-        # 通常のURLからユーザー名を抽出するパターン
-        patterns = [
-            r"https?://zenn\.dev/([a-zA-Z0-9_-]+)(?:/.*)?$",  # 通常のZenn URL
-            r"@([a-zA-Z0-9_-]+)",  # @username形式
-            r"^([a-zA-Z0-9_-]+)$",  # ユーザー名のみ
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-
-        return None
+        # 企業アカウントのURLの場合は、p/の後のユーザー名を返す
+        name = _search_zenn_url(url, "zenn.dev/p/")
+        if name:
+            return name, True
+
+        # 通常のZenn URL
+        name = _search_zenn_url(url, "zenn.dev/")
+        if name:
+            return name, False
+
+        # @username形式（文字列中の最初の@に続くユーザー名）
+        at = url.find("@")
+        while at != -1:
+            name = _leading_username(url[at + 1 :])
+            if name:
+                return name, False
+            at = url.find("@", at + 1)
+
+        # ユーザー名のみ（末尾の改行1つは許容）
+        name = _strip_final_newline(url)
+        return (name, False) if _is_valid_username(name) else None
 
     def process_url(self, url: str, tone: str, article_limit: int, template: str = "") -> Tuple[str, str]:
         """
@@ -72,12 +158,10 @@ class GradioInterface:
             Tuple[str, str]: 処理結果のメッセージと生成された投稿文
         """
         # URLからユーザー名を抽出
-        username = self.extract_username(url)
-        if not username:
+        result = self.extract_username(url)
+        if not result:
             return "エラー: 有効なZennのURLまたはユーザー名を入力してください。", ""
-
-        # 企業アカウントかどうかを判断
-        is_company = url.startswith("https://zenn.dev/p/") or url.startswith("http://zenn.dev/p/")
+        username, is_company = result
 
         # ZennDataFetcherのインスタンスを作成（未設定の場合）
         if not self.fetcher:
@@ -97,10 +181,6 @@ class GradioInterface:
             logger.error(f"記事の取得中にエラーが発生しました: {e}")
             return f"エラー: 記事の取得中にエラーが発生しました: {e}", ""
 
-        # PostGeneratorのインスタンスを作成（未設定の場合）
-        if not self.generator:
-            self.generator = PostGenerator()
-
         # 投稿文を生成
         try:
             post = self.generator.generate_post(self.current_articles, tone, template)
@@ -114,9 +194,9 @@ class GradioInterface:
             logger.error(f"投稿文の生成中にエラーが発生しました: {e}")
             return f"エラー: 投稿文の生成中にエラーが発生しました: {e}", ""
 
-    def process_url_streaming(self, url: str, tone: str, article_limit: int, template: str = ""):
+    async def process_url_streaming(self, url: str, tone: str, article_limit: int, template: str = ""):
         """
-        URLを処理して投稿文を生成する（ストリーミング版）
+        URLを処理して投稿文を生成する（非同期ストリーミング版）
 
         Args:
             url: ZennのURL
@@ -128,13 +208,11 @@ class GradioInterface:
             Tuple[str, str]: 処理結果のメッセージと生成された投稿文
         """
         # URLからユーザー名を抽出
-        username = self.extract_username(url)
-        if not username:
+        result = self.extract_username(url)
+        if not result:
             yield "エラー: 有効なZennのURLまたはユーザー名を入力してください。", ""
             return
-
-        # 企業アカウントかどうかを判断
-        is_company = url.startswith("https://zenn.dev/p/") or url.startswith("http://zenn.dev/p/")
+        username, is_company = result
 
         # ZennDataFetcherのインスタンスを作成（未設定の場合）
         if not self.fetcher:
@@ -148,7 +226,11 @@ class GradioInterface:
         # 人気記事を取得
         try:
             yield f"処理中: ユーザー '{username}' の人気記事を取得しています...", ""
-            self.current_articles = self.fetcher.get_popular_articles(limit=article_limit)
+            # 記事の取得は同期処理のため、イベントループを塞がないようにスレッドで実行
+            loop = asyncio.get_running_loop()
+            self.current_articles = await loop.run_in_executor(
+                None, functools.partial(self.fetcher.get_popular_articles, limit=article_limit)
+            )
             if not self.current_articles:
                 yield f"エラー: ユーザー '{username}' の記事が見つかりませんでした。", ""
                 return
@@ -157,10 +239,6 @@ class GradioInterface:
             yield f"エラー: 記事の取得中にエラーが発生しました: {e}", ""
             return
 
-        # PostGeneratorのインスタンスを作成（未設定の場合）
-        if not self.generator:
-            self.generator = PostGenerator()
-
         # 投稿文を生成（ストリーミング）
         try:
             # 定型文が使用される場合のメッセージを変更
@@ -169,15 +247,28 @@ class GradioInterface:
             else:
                 yield f"処理中: ユーザー '{username}' の人気記事から投稿文を生成しています...", ""
 
+            # 定型文が使用された場合のメッセージを変更
+            if template:
+                success_status = "成功: 定型文を使用して投稿文を生成しました。"
+            else:
+                success_status = f"成功: ユーザー '{username}' の人気記事から投稿文を生成しました。"
+
+            # チャンクごとではなく、一定の文字数または時間ごとにまとめて画面を更新
             post = ""
-            for chunk in self.generator.generate_post_streaming(self.current_articles, tone, template):
+            last_yield_len = 0
+            last_yield_time = time.monotonic()
+            async for chunk in self.generator.generate_post_astreaming(self.current_articles, tone, template):
                 post += chunk
 
-                # 定型文が使用された場合のメッセージを変更
-                if template:
-                    yield "成功: 定型文を使用して投稿文を生成しました。", post
-                else:
-                    yield f"成功: ユーザー '{username}' の人気記事から投稿文を生成しました。", post
+                now = time.monotonic()
+                if len(post) - last_yield_len >= STREAM_YIELD_MIN_CHARS or now - last_yield_time >= STREAM_YIELD_INTERVAL:
+                    last_yield_len = len(post)
+                    last_yield_time = now
+                    yield success_status, post
+
+            # 未出力の残りを出力
+            if len(post) > last_yield_len:
+                yield success_status, post
         except Exception as e:
             logger.error(f"投稿文の生成中にエラーが発生しました: {e}")
             yield f"エラー: 投稿文の生成中にエラーが発生しました: {e}", post
@@ -234,9 +325,13 @@ class GradioInterface:
             def map_tone(tone):
                 return "personal" if tone == "個人向け" else "corporate"
 
-            # ボタンクリック時の処理
+            # ボタンクリック時の処理（生成中の投稿文を逐次表示）
+            async def generate(url, template, tone, limit):
+                async for outputs in self.process_url_streaming(url, map_tone(tone), limit, template):
+                    yield outputs
+
             generate_btn.click(
-                fn=lambda url, template, tone, limit: self.process_url(url, map_tone(tone), limit, template),
+                fn=generate,
                 inputs=[url_input, template_input, tone_radio, article_limit],
                 outputs=[status_output, post_output],
             )
@@ -264,5 +359,7 @@ class GradioInterface:
         Args:
             **kwargs: gr.launch()に渡す追加の引数
         """
-        interface = self.build_interface()
-        interface.launch(**kwargs)
+        # 再起動時はコンポーネントを作り直さずに構築済みのものを使用
+        if self._interface is None:
+            self._interface = self.build_interface()
+        self._interface.launch(**kwargs)
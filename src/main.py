@@ -6,7 +6,6 @@ import os
 import logging
 import argparse
 from dotenv import load_dotenv
-from .gradio_interface import GradioInterface
 
 # ロギングの設定
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
@@ -24,6 +23,10 @@ def main():
     parser.add_argument("--share", action="store_true", help="Gradioの共有リンクを生成")
     args = parser.parse_args()
 
+    # gradioとopenaiは読み込みに時間がかかるため、引数の解析後にインポートする
+    from .gradio_interface import GradioInterface
+    from .post_generator import PostGenerator
+
     # OpenAI APIキーの確認
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
@@ -31,7 +34,7 @@ def main():
 
     # Gradioインターフェースの起動
     logger.info("Zenn記事推薦＆SNS投稿文生成ツールを起動しています...")
-    interface = GradioInterface()
+    interface = GradioInterface(generator=PostGenerator(api_key=api_key))
     interface.launch(server_port=args.port, share=args.share)
 
 
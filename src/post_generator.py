@@ -2,14 +2,84 @@
 SNS投稿文を生成するモジュール
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Optional, Tuple
 import logging
 import os
-import openai
+import time
+import hashlib
+from collections import OrderedDict
+from operator import attrgetter
+from .zenn_data_fetcher import Article
 
 # ロガーの設定
 logger = logging.getLogger(__name__)
 
+# 生成結果をキャッシュする最大件数
+COMPLETION_CACHE_SIZE = 128
+
+# 生成結果を再利用する秒数（連続クリックなどの重複呼び出しだけを省略し、再生成では新しい投稿文を作る）
+COMPLETION_CACHE_TTL = 30
+
+# プロンプトに含める記事概要の最大トークン数
+DESCRIPTION_MAX_TOKENS = 200
+
+
+def _get_openai():
+    """
+    openaiモジュールを取得する（読み込みに時間がかかるため、初回使用時にインポートする）
+
+    Returns:
+        module: openaiモジュール
+    """
+    import openai
+
+    return openai
+
+
+# 個人向けのプロンプト
+_SYSTEM_PERSONAL = """
+あなたは個人のSNS投稿を作成する専門家です。
+Zennの人気記事を紹介するTwitter（X）投稿を作成してください。
+以下の特徴を持つ投稿を作成してください：
+
+1. カジュアルで親しみやすいトーン
+2. 読者との対話を意識した文体
+3. 絵文字を適度に使用
+4. 280文字以内に収める
+5. ハッシュタグを1-2個含める
+6. 記事のURLを含める（最も人気のある記事のURLを優先）
+"""
+
+_USER_PERSONAL_TEMPLATE = """
+以下の人気記事情報をもとに、Twitterの投稿文を作成してください。
+
+{articles_text}
+
+最もいいね数の多い記事を中心に紹介し、読者の興味を引く投稿にしてください。
+"""
+
+# 企業向けのプロンプト
+_SYSTEM_CORPORATE = """
+あなたは企業のSNS投稿を作成する専門家です。
+Zennの人気記事を紹介するTwitter（X）投稿を作成してください。
+以下の特徴を持つ投稿を作成してください：
+
+1. フォーマルで丁寧なトーン
+2. 情報提供を意識した文体
+3. 絵文字を控えめに使用
+4. 280文字以内に収める
+5. ハッシュタグを1-2個含める
+6. 記事のURLを含める（最も人気のある記事のURLを優先）
+"""
+
+_USER_CORPORATE_TEMPLATE = """
+以下の人気記事情報をもとに、Twitterの投稿文を作成してください。
+
+{articles_text}
+
+最もいいね数の多い記事を中心に紹介し、専門性と信頼性を感じさせる投稿にしてください。
+"""
+
 
 class PostGenerator:
     """SNS投稿文を生成するクラス"""
@@ -24,11 +94,27 @@ class PostGenerator:
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self.api_key:
             logger.warning("OpenAI APIキーが設定されていません。環境変数OPENAI_API_KEYを設定してください。")
-        else:
-            openai.api_key = self.api_key
+
+        # OpenAIのクライアント（初回使用時に作成）
+        self._client = None
+        self._aclient = None
+
+        # 記事概要のトークン数計算に使うエンコーディング（初回使用時に作成）
+        self._encoding = None
+
+        # プロンプトをキーとした生成結果のLRUキャッシュ（キー -> (保存時刻, 生成結果)）
+        self._completion_cache = OrderedDict()
+
+        # 直前にフォーマットした記事情報のキャッシュ（キー, フォーマット結果）
+        self._format_cache = (None, "")
 
     def generate_post(
-        self, articles: List[Dict[str, Any]], tone: str = "personal", template: str = "", max_tokens: int = 500
+        self,
+        articles: List[Article],
+        tone: str = "personal",
+        template: str = "",
+        max_tokens: int = 500,
+        full_top_k: int = 1,
     ) -> str:
         """
         LLMを使って投稿文を生成
@@ -38,6 +124,7 @@ class PostGenerator:
             tone: 投稿のトーン（"personal"または"corporate"）
             template: 定型文（空文字列の場合は使用しない）
             max_tokens: 生成する最大トークン数
+            full_top_k: 全項目を記載する上位記事数（残りの記事はタイトルといいね数のみ）
 
         Returns:
             str: 生成された投稿文
@@ -49,33 +136,28 @@ class PostGenerator:
             return "記事が見つかりませんでした。"
 
         # 記事情報をテキスト形式に変換
-        articles_text = self._format_articles_for_prompt(articles)
+        articles_text = self._format_articles_for_prompt(articles, full_top_k)
 
         # 定型文の処理は後で行う（LLMの結果に追加する）
 
         # トーンに応じたプロンプトを作成
-        if tone.lower() == "corporate":
-            prompt = self._create_corporate_prompt(articles_text)
-        else:
-            prompt = self._create_personal_prompt(articles_text)
+        prompt = self._build_prompt(articles_text, tone)
 
         try:
-            # OpenAI APIを使用して投稿文を生成
-            response = openai.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "system", "content": prompt["system"]}, {"role": "user", "content": prompt["user"]}],
-                max_tokens=max_tokens,
-                temperature=0.7,
-            )
-            generated_post = response.choices[0].message.content.strip()
+            # 同じプロンプトで生成済みの場合はキャッシュを使用
+            cache_key = self._completion_cache_key(prompt, max_tokens)
+            content = self._get_cached_completion(cache_key)
+            if content is None:
+                # OpenAI APIを使用して投稿文を生成
+                response = self._get_client().chat.completions.create(**self._completion_params(prompt, max_tokens))
+                content = response.choices[0].message.content
+                self._store_completion(cache_key, content)
+            generated_post = content.strip()
 
             # 定型文が指定されている場合は、投稿文の冒頭に追加
             if template:
-                # 記事のURLを定型文に埋め込む
-                if "{url}" in template and articles:
-                    # 最初の記事のURLを使用
-                    url = articles[0]["url"]
-                    template = template.replace("{url}", url)
+                # 記事のURLを定型文に埋め込む（プロンプトで最も人気とした、いいね数が最も多い記事のURLを使用）
+                template = template.replace("{url}", max(articles, key=attrgetter("likes")).url)
 
                 # 定型文と生成された投稿文を結合
                 return f"{template}\n\n{generated_post}"
@@ -85,94 +167,242 @@ class PostGenerator:
             logger.error(f"投稿文の生成中にエラーが発生しました: {e}")
             return f"投稿文の生成中にエラーが発生しました: {e}"
 
-    def _format_articles_for_prompt(self, articles: List[Dict[str, Any]]) -> str:
+    def _get_client(self):
+        """
+        OpenAIの同期クライアントを取得（未作成の場合は作成）
+
+        Returns:
+            openai.OpenAI: 同期クライアント
+        """
+        if self._client is None:
+            self._client = _get_openai().OpenAI(api_key=self.api_key)
+        return self._client
+
+    def _get_async_client(self):
+        """
+        OpenAIの非同期クライアントを取得（未作成の場合は作成）
+
+        Returns:
+            openai.AsyncOpenAI: 非同期クライアント
+        """
+        if self._aclient is None:
+            self._aclient = _get_openai().AsyncOpenAI(api_key=self.api_key)
+        return self._aclient
+
+    def _completion_cache_key(self, prompt: Dict[str, str], max_tokens: int) -> str:
+        """
+        生成結果キャッシュのキーを作成
+
+        Args:
+            prompt: システムプロンプトとユーザープロンプト
+            max_tokens: 生成する最大トークン数
+
+        Returns:
+            str: プロンプトと最大トークン数から計算したハッシュ値
+        """
+        key_source = f"{prompt['system']}\0{prompt['user']}\0{max_tokens}"
+        return hashlib.blake2b(key_source.encode(), digest_size=16).hexdigest()
+
+    def _get_cached_completion(self, cache_key: str) -> Optional[str]:
+        """
+        キャッシュから生成結果を取得（COMPLETION_CACHE_TTL秒を過ぎたものは破棄する）
+
+        Args:
+            cache_key: キャッシュのキー
+
+        Returns:
+            Optional[str]: キャッシュされた生成結果、存在しないか期限切れの場合はNone
+        """
+        entry = self._completion_cache.get(cache_key)
+        if entry is None:
+            return None
+
+        stored_at, content = entry
+        if time.monotonic() - stored_at >= COMPLETION_CACHE_TTL:
+            del self._completion_cache[cache_key]
+            return None
+
+        self._completion_cache.move_to_end(cache_key)
+        return content
+
+    def _store_completion(self, cache_key: str, content: str):
+        """
+        生成結果をキャッシュに保存（上限を超えた場合は最も古いものを削除）
+
+        Args:
+            cache_key: キャッシュのキー
+            content: 生成結果
+        """
+        self._completion_cache[cache_key] = (time.monotonic(), content)
+        self._completion_cache.move_to_end(cache_key)
+        if len(self._completion_cache) > COMPLETION_CACHE_SIZE:
+            self._completion_cache.popitem(last=False)
+
+    def _format_articles_for_prompt(self, articles: List[Article], full_top_k: int = 1) -> str:
         """
         記事情報をプロンプト用にフォーマット
 
+        いいね数の多い順に並べ、上位full_top_k件のみ全項目を記載し、
+        残りの記事はタイトルといいね数だけにしてプロンプトのトークン数を抑える。
+
         Args:
             articles: 記事情報のリスト
+            full_top_k: 全項目を記載する上位記事数
 
         Returns:
             str: フォーマットされた記事情報
         """
-        formatted_text = "【人気記事リスト】\n"
-        for i, article in enumerate(articles, 1):
-            formatted_text += f"{i}. タイトル: {article['title']}\n"
-            formatted_text += f"   URL: {article['url']}\n"
-            formatted_text += f"   いいね数: {article['likes']}\n"
-            formatted_text += f"   公開日: {article['published_at']}\n"
-            formatted_text += f"   概要: {article['description']}\n"
-            formatted_text += f"   タグ: {', '.join(article['tags'])}\n\n"
+        # 同じ記事リストを続けてフォーマットする場合はキャッシュを使用
+        cache_key = (full_top_k, tuple((article.url, article.likes) for article in articles))
+        if cache_key == self._format_cache[0]:
+            return self._format_cache[1]
+
+        parts = ["【人気記事リスト】\n"]
+        for i, article in enumerate(sorted(articles, key=attrgetter("likes"), reverse=True), 1):
+            if i > full_top_k:
+                parts.append(f"{i}. {article.title} (いいね数: {article.likes})\n")
+                continue
+
+            parts.append(
+                f"{i}. タイトル: {article.title}\n"
+                f"   URL: {article.url}\n"
+                f"   いいね数: {article.likes}\n"
+                f"   公開日: {article.published_at}\n"
+                f"   概要: {self._truncate_description(article.description)}\n"
+                f"   タグ: {', '.join(article.tags)}\n\n"
+            )
+        formatted_text = "".join(parts)
+
+        self._format_cache = (cache_key, formatted_text)
         return formatted_text
 
-    def _create_personal_prompt(self, articles_text: str) -> Dict[str, str]:
+    def _truncate_description(self, description: str) -> str:
         """
-        個人向けのプロンプトを作成
+        記事概要をDESCRIPTION_MAX_TOKENSトークンまでに切り詰める
 
         Args:
-            articles_text: フォーマットされた記事情報
+            description: 記事概要
 
         Returns:
-            Dict[str, str]: システムプロンプトとユーザープロンプト
+            str: 切り詰めた記事概要
         """
-        system_prompt = """
-あなたは個人のSNS投稿を作成する専門家です。
-Zennの人気記事を紹介するTwitter（X）投稿を作成してください。
-以下の特徴を持つ投稿を作成してください：
+        # トークン数はバイト数を超えないため、短い概要はエンコードせずにそのまま使用
+        if not description or len(description.encode()) <= DESCRIPTION_MAX_TOKENS:
+            return description
 
-1. カジュアルで親しみやすいトーン
-2. 読者との対話を意識した文体
-3. 絵文字を適度に使用
-4. 280文字以内に収める
-5. ハッシュタグを1-2個含める
-6. 記事のURLを含める（最も人気のある記事のURLを優先）
-"""
-
-        user_prompt = f"""
-以下の人気記事情報をもとに、Twitterの投稿文を作成してください。
+        if self._encoding is None:
+            import tiktoken
 
-{articles_text}
+            self._encoding = tiktoken.encoding_for_model("gpt-3.5-turbo")
 
-最もいいね数の多い記事を中心に紹介し、読者の興味を引く投稿にしてください。
-"""
+        tokens = self._encoding.encode(description)
+        if len(tokens) <= DESCRIPTION_MAX_TOKENS:
+            return description
 
-        return {"system": system_prompt, "user": user_prompt}
+        logger.info(f"記事概要を{len(tokens)}トークンから{DESCRIPTION_MAX_TOKENS}トークンに切り詰めました")
+        # 途中で切れたマルチバイト文字は置換文字になるため取り除く
+        return self._encoding.decode(tokens[:DESCRIPTION_MAX_TOKENS]).rstrip("\ufffd")
 
-    def _create_corporate_prompt(self, articles_text: str) -> Dict[str, str]:
+    def _build_prompt(self, articles_text: str, tone: str) -> Dict[str, str]:
         """
-        企業向けのプロンプトを作成
+        トーンに応じたプロンプトを作成
 
         Args:
             articles_text: フォーマットされた記事情報
+            tone: 投稿のトーン（"personal"または"corporate"）
 
         Returns:
             Dict[str, str]: システムプロンプトとユーザープロンプト
         """
-        system_prompt = """
-あなたは企業のSNS投稿を作成する専門家です。
-Zennの人気記事を紹介するTwitter（X）投稿を作成してください。
-以下の特徴を持つ投稿を作成してください：
+        if tone.lower() == "corporate":
+            system_prompt, user_template = _SYSTEM_CORPORATE, _USER_CORPORATE_TEMPLATE
+        else:
+            system_prompt, user_template = _SYSTEM_PERSONAL, _USER_PERSONAL_TEMPLATE
 
-1. フォーマルで丁寧なトーン
-2. 情報提供を意識した文体
-3. 絵文字を控えめに使用
-4. 280文字以内に収める
-5. ハッシュタグを1-2個含める
-6. 記事のURLを含める（最も人気のある記事のURLを優先）
-"""
+        return {"system": system_prompt, "user": user_template.format(articles_text=articles_text)}
 
-        user_prompt = f"""
-以下の人気記事情報をもとに、Twitterの投稿文を作成してください。
+    def _completion_params(self, prompt: Dict[str, str], max_tokens: int) -> Dict:
+        """
+        Chat Completions APIに渡すパラメータを作成
 
-{articles_text}
+        Args:
+            prompt: システムプロンプトとユーザープロンプト
+            max_tokens: 生成する最大トークン数
 
-最もいいね数の多い記事を中心に紹介し、専門性と信頼性を感じさせる投稿にしてください。
-"""
+        Returns:
+            Dict: APIに渡すパラメータ
+        """
+        return {
+            "model": "gpt-3.5-turbo",
+            "messages": [{"role": "system", "content": prompt["system"]}, {"role": "user", "content": prompt["user"]}],
+            "max_tokens": max_tokens,
+            "temperature": 0.7,
+        }
+
+    def _prepare_streaming(
+        self, articles: List[Article], tone: str, template: str, max_tokens: int, full_top_k: int
+    ) -> Tuple[List[str], Optional[Dict[str, str]], str]:
+        """
+        ストリーミング生成の前処理（入力の確認、定型文の置換、プロンプトの作成、キャッシュの確認）
 
-        return {"system": system_prompt, "user": user_prompt}
+        Args:
+            articles: 記事情報のリスト
+            tone: 投稿のトーン（"personal"または"corporate"）
+            template: 定型文（空文字列の場合は使用しない）
+            max_tokens: 生成する最大トークン数
+            full_top_k: 全項目を記載する上位記事数（残りの記事はタイトルといいね数のみ）
+
+        Returns:
+            Tuple[List[str], Optional[Dict[str, str]], str]: 生成結果より先に出力するテキスト、
+                APIに送るプロンプト（APIを呼ぶ必要がない場合はNone）、キャッシュのキー
+        """
+        if not self.api_key:
+            return ["OpenAI APIキーが設定されていないため、投稿文を生成できません。"], None, ""
+
+        if not articles:
+            return ["記事が見つかりませんでした。"], None, ""
+
+        # 定型文の処理は後で行う（LLMの結果に追加する）
+        # 記事のURLを定型文に埋め込む（プロンプトで最も人気とした、いいね数が最も多い記事のURLを使用）
+        processed_template = template.replace("{url}", max(articles, key=attrgetter("likes")).url) if template else ""
+
+        # 記事情報をテキスト形式に変換
+        articles_text = self._format_articles_for_prompt(articles, full_top_k)
+
+        # トーンに応じたプロンプトを作成
+        prompt = self._build_prompt(articles_text, tone)
+        cache_key = self._completion_cache_key(prompt, max_tokens)
+
+        # 定型文が指定されている場合は、最初に定型文を出力
+        head = [processed_template + "\n\n"] if processed_template else []
+
+        # 同じプロンプトで生成済みの場合はAPIを呼ばずにキャッシュを返す
+        cached_post = self._get_cached_completion(cache_key)
+        if cached_post is not None:
+            return head + [cached_post], None, cache_key
+
+        return head, prompt, cache_key
+
+    @staticmethod
+    def _delta_content(chunk) -> str:
+        """
+        ストリーミングのチャンクから生成されたテキストを取り出す
+
+        Args:
+            chunk: Chat Completions APIのストリーミングチャンク
+
+        Returns:
+            str: 生成されたテキスト（ロールのみのチャンクなど、内容がない場合は空文字列）
+        """
+        return chunk.choices[0].delta.content or ""
 
     def generate_post_streaming(
-        self, articles: List[Dict[str, Any]], tone: str = "personal", template: str = "", max_tokens: int = 500
+        self,
+        articles: List[Article],
+        tone: str = "personal",
+        template: str = "",
+        max_tokens: int = 500,
+        full_top_k: int = 1,
     ):
         """
         LLMを使って投稿文を生成（ストリーミング版）
@@ -182,56 +412,80 @@ Zennの人気記事を紹介するTwitter（X）投稿を作成してくださ
             tone: 投稿のトーン（"personal"または"corporate"）
             template: 定型文（空文字列の場合は使用しない）
             max_tokens: 生成する最大トークン数
+            full_top_k: 全項目を記載する上位記事数（残りの記事はタイトルといいね数のみ）
 
         Yields:
             str: 生成された投稿文の一部
         """
-        if not self.api_key:
-            yield "OpenAI APIキーが設定されていないため、投稿文を生成できません。"
+        head, prompt, cache_key = self._prepare_streaming(articles, tone, template, max_tokens, full_top_k)
+        if prompt is None:
+            yield from head
             return
 
-        if not articles:
-            yield "記事が見つかりませんでした。"
-            return
+        try:
+            # OpenAI APIを使用して投稿文を生成（ストリーミング）
+            stream = self._get_client().chat.completions.create(**self._completion_params(prompt, max_tokens), stream=True)
+            yield from head
 
-        # 定型文の処理は後で行う（LLMの結果に追加する）
-        processed_template = ""
-        if template:
-            # 記事のURLを定型文に埋め込む
-            if "{url}" in template and articles:
-                # 最初の記事のURLを使用
-                url = articles[0]["url"]
-                processed_template = template.replace("{url}", url)
-            else:
-                processed_template = template
+            # LLMの出力をストリーミング
+            contents = []
+            for chunk in stream:
+                content = self._delta_content(chunk)
+                if content:
+                    contents.append(content)
+                    yield content
 
-        # 記事情報をテキスト形式に変換
-        articles_text = self._format_articles_for_prompt(articles)
+            # 最後まで生成できた場合のみキャッシュに保存
+            self._store_completion(cache_key, "".join(contents))
+        except Exception as e:
+            logger.error(f"投稿文の生成中にエラーが発生しました: {e}")
+            yield f"投稿文の生成中にエラーが発生しました: {e}"
 
-        # トーンに応じたプロンプトを作成
-        if tone.lower() == "corporate":
-            prompt = self._create_corporate_prompt(articles_text)
-        else:
-            prompt = self._create_personal_prompt(articles_text)
+    async def generate_post_astreaming(
+        self,
+        articles: List[Article],
+        tone: str = "personal",
+        template: str = "",
+        max_tokens: int = 500,
+        full_top_k: int = 1,
+    ):
+        """
+        LLMを使って投稿文を生成（非同期ストリーミング版）
+
+        Args:
+            articles: 記事情報のリスト
+            tone: 投稿のトーン（"personal"または"corporate"）
+            template: 定型文（空文字列の場合は使用しない）
+            max_tokens: 生成する最大トークン数
+            full_top_k: 全項目を記載する上位記事数（残りの記事はタイトルといいね数のみ）
+
+        Yields:
+            str: 生成された投稿文の一部
+        """
+        head, prompt, cache_key = self._prepare_streaming(articles, tone, template, max_tokens, full_top_k)
+        if prompt is None:
+            for text in head:
+                yield text
+            return
 
         try:
-            # OpenAI APIを使用して投稿文を生成（ストリーミング）
-            stream = openai.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "system", "content": prompt["system"]}, {"role": "user", "content": prompt["user"]}],
-                max_tokens=max_tokens,
-                temperature=0.7,
-                stream=True,
+            # OpenAI APIを使用して投稿文を生成（非同期ストリーミング）
+            stream = await self._get_async_client().chat.completions.create(
+                **self._completion_params(prompt, max_tokens), stream=True
             )
-
-            # 定型文が指定されている場合は、最初に定型文を出力
-            if processed_template:
-                yield processed_template + "\n\n"
+            for text in head:
+                yield text
 
             # LLMの出力をストリーミング
-            for chunk in stream:
-                if chunk.choices[0].delta.content:
-                    yield chunk.choices[0].delta.content
+            contents = []
+            async for chunk in stream:
+                content = self._delta_content(chunk)
+                if content:
+                    contents.append(content)
+                    yield content
+
+            # 最後まで生成できた場合のみキャッシュに保存
+            self._store_completion(cache_key, "".join(contents))
         except Exception as e:
             logger.error(f"投稿文の生成中にエラーが発生しました: {e}")
             yield f"投稿文の生成中にエラーが発生しました: {e}"
@@ -2,22 +2,209 @@
 Zennのアカウントから記事情報を取得するモジュール
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, NamedTuple, Optional, Tuple
+import io
+import functools
+import threading
+import heapq
 import re
+import time
 import logging
-import requests
-import xml.etree.ElementTree as ET
-from bs4 import BeautifulSoup
-from datetime import datetime
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from lxml import etree
+import lxml.html
+from lxml.cssselect import CSSSelector
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from operator import attrgetter
 import random
 
 # ロガーの設定
 logger = logging.getLogger(__name__)
 
+# HTTPレスポンスのキャッシュ設定（人気記事は頻繁に変わらないため、同じページへの再リクエストを省略する）
+HTTP_CACHE_NAME = "zenn_cache"
+HTTP_CACHE_EXPIRE_AFTER = 600  # 秒
+
+# コネクションプールの設定（フィード・ページの取得で同じ接続を再利用する）
+HTTP_POOL_SIZE = 32
+HTTP_RETRY = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+HTTP_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+)
+
+# すべてのZennDataFetcherで共有するHTTPセッション（_get_sessionで初回に作成する）
+_shared_session: Optional[requests_cache.CachedSession] = None
+
+# 記事の解析で使う正規表現
+_DIGITS_RE = re.compile(r"(\d+)")
+_SLUG_RE = re.compile(r"/articles/([^/]+)$")
+
+# 「Likes」を含むspan要素を探すXPath
+# （cssselectの:containsはlxmlの拡張関数に変換され、コンパイル済みのセレクタを別の文書で使い回すと失敗するため、XPathで書く）
+_LIKES_SPAN_XPATH = "descendant-or-self::span[contains(., 'Likes')]"
+_LIKES_CSS = ".likes, [data-test='likes-count']"
+
+# RSSフィードの<item>から取り出す子要素
+_RSS_ITEM_FIELDS = frozenset({"title", "link", "description", "pubDate", "guid"})
+
+# 取得した記事情報を再利用する秒数と、キャッシュする最大アカウント数
+ARTICLES_CACHE_TTL = 300
+ARTICLES_CACHE_SIZE = 64
+
+# ETag/Last-Modifiedとともに解析結果を保持する最大フィード数
+FEED_CACHE_SIZE = 64
+
+# 公開日が不明な記事のソート用の日時（最も古い日時として扱う）
+MIN_PUB_DATETIME = datetime.min.replace(tzinfo=timezone.utc)
+
+
+class Article(NamedTuple):
+    """
+    記事情報
+
+    Attributes:
+        title: タイトル
+        url: 記事のURL
+        likes: いいね数
+        published_at: 公開日（取得元の文字列のまま）
+        description: 概要
+        tags: タグのリスト
+        guid: RSSフィードのGUID（スクレイピングで取得した場合は空文字列）
+        pub_datetime: 公開日を解析した日時（解析できない場合はMIN_PUB_DATETIME）
+    """
+
+    title: str
+    url: str
+    likes: int
+    published_at: str
+    description: str
+    tags: List[str]
+    guid: str = ""
+    pub_datetime: datetime = MIN_PUB_DATETIME
+
+
+def _parse_pub_date(pub_date: str) -> datetime:
+    """
+    RSSフィードの公開日（RFC 822形式）を解析する
+
+    Args:
+        pub_date: 公開日の文字列
+
+    Returns:
+        datetime: タイムゾーン付きの日時、解析できない場合はMIN_PUB_DATETIME
+    """
+    if not pub_date:
+        return MIN_PUB_DATETIME
+
+    try:
+        pub_datetime = parsedate_to_datetime(pub_date)
+    except (TypeError, ValueError) as e:
+        logger.warning(f"公開日を解析できませんでした: {pub_date}, {e}")
+        return MIN_PUB_DATETIME
+
+    # タイムゾーンのない日時はUTCとして扱い、タイムゾーン付きの日時と比較できるようにする
+    if pub_datetime.tzinfo is None:
+        pub_datetime = pub_datetime.replace(tzinfo=timezone.utc)
+    return pub_datetime
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_selector(selector: str) -> CSSSelector:
+    """
+    CSSセレクタをコンパイルする（同じセレクタはXPathへの変換を再利用）
+
+    :containsなどlxmlの拡張関数に変換されるセレクタはキャッシュしたものを使い回せないため、渡さないこと。
+
+    Args:
+        selector: CSSセレクタ
+
+    Returns:
+        CSSSelector: コンパイル済みのセレクタ
+    """
+    return CSSSelector(selector, translator="html")
+
+
+def _select(element, selector: str) -> list:
+    """
+    CSSセレクタに一致する要素をすべて取得する
+
+    Args:
+        element: 検索対象のlxml要素
+        selector: CSSセレクタ
+
+    Returns:
+        list: 一致した要素のリスト（文書順）
+    """
+    return _compile_selector(selector)(element)
+
+
+def _select_one(element, selector: str):
+    """
+    CSSセレクタに一致する最初の要素を取得する
+
+    Args:
+        element: 検索対象のlxml要素
+        selector: CSSセレクタ
+
+    Returns:
+        一致した最初の要素、見つからない場合はNone
+    """
+    elements = _select(element, selector)
+    return elements[0] if elements else None
+
+
+def _select_first(element, *selectors: str):
+    """
+    複数のCSSセレクタを順に試し、最初に見つかった要素を取得する
+
+    lxmlの要素は子要素がないと偽と評価されるため、orで連結せずにNoneかどうかで判定する。
+
+    Args:
+        element: 検索対象のlxml要素
+        *selectors: 優先順に並べたCSSセレクタ
+
+    Returns:
+        最初に見つかった要素、どのセレクタにも一致しない場合はNone
+    """
+    for selector in selectors:
+        found = _select_one(element, selector)
+        if found is not None:
+            return found
+    return None
+
+
+def _get_session() -> requests_cache.CachedSession:
+    """
+    共有のHTTPセッションを取得する
+
+    インスタンスごとにセッションを作らず、コネクションプールとキャッシュをプロセス内で再利用する。
+
+    Returns:
+        requests_cache.CachedSession: 共有のHTTPセッション
+    """
+    global _shared_session
+    if _shared_session is None:
+        session = requests_cache.CachedSession(HTTP_CACHE_NAME, backend="sqlite", expire_after=HTTP_CACHE_EXPIRE_AFTER)
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=HTTP_RETRY)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["User-Agent"] = HTTP_USER_AGENT
+        _shared_session = session
+    return _shared_session
+
 
 class ZennDataFetcher:
     """Zennのアカウントから記事情報を取得するクラス"""
 
+    # 取得した記事情報のLRUキャッシュ（(ユーザー名, 企業アカウントかどうか, 最大記事数) -> (取得時刻, 記事情報)）
+    # 記事の取得はスレッドで実行されるため、ロックを取って操作する
+    _articles_cache: "OrderedDict[Tuple[str, bool, int], Tuple[float, Tuple[Article, ...]]]" = OrderedDict()
+    _articles_cache_lock = threading.Lock()
+
     def __init__(self, username: str, is_company: bool = False):
         """
         ZennDataFetcherの初期化
@@ -33,12 +220,13 @@ class ZennDataFetcher:
         # URLを設定
         self.setup_urls()
 
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-            }
-        )
+        # HTTPセッションは全インスタンスで共有する
+        self.session = _get_session()
+
+        # 解析済みフィードのLRUキャッシュ（(フィードURL, 最大記事数) -> (ETagまたはLast-Modified, 記事情報)）
+        # 記事の取得はスレッドで実行されるため、ロックを取って操作する
+        self._feed_cache = OrderedDict()
+        self._feed_cache_lock = threading.Lock()
 
     def setup_urls(self):
         """URLを設定する"""
@@ -63,15 +251,110 @@ class ZennDataFetcher:
         # ユーザー名の検証をスキップ（常にTrueを返す）
         return True
 
-    def fetch_articles(self, max_articles: int = 100) -> List[Dict[str, Any]]:
+    def fetch_articles(self, max_articles: int = 100) -> List[Article]:
         """
-        ZennのRSSフィードから記事情報を取得
+        記事情報を取得（同じアカウントの取得結果はARTICLES_CACHE_TTL秒間再利用する）
 
         Args:
             max_articles: 取得する最大記事数（デフォルト: 100）
 
         Returns:
-            List[Dict[str, Any]]: 記事情報のリスト
+            List[Article]: 記事情報のリスト
+        """
+        cache_key = (self.username, self.is_company, max_articles)
+        cached_articles = self._get_cached_articles(cache_key)
+        if cached_articles is not None:
+            logger.info(f"取得済みの記事情報を使用します: {self.user_url}")
+            return cached_articles
+
+        articles = self._fetch_articles_from_feed(max_articles)
+        if articles:
+            self._store_articles(cache_key, articles)
+        return articles
+
+    def _get_cached_articles(self, cache_key: Tuple[str, bool, int]) -> Optional[List[Article]]:
+        """
+        キャッシュから記事情報を取得（ARTICLES_CACHE_TTL秒を過ぎたものは破棄する）
+
+        Args:
+            cache_key: キャッシュのキー
+
+        Returns:
+            Optional[List[Article]]: キャッシュされた記事情報、存在しないか期限切れの場合はNone
+        """
+        with self._articles_cache_lock:
+            entry = self._articles_cache.get(cache_key)
+            if entry is None:
+                return None
+
+            fetched_at, cached_articles = entry
+            if time.monotonic() - fetched_at >= ARTICLES_CACHE_TTL:
+                del self._articles_cache[cache_key]
+                return None
+
+            self._articles_cache.move_to_end(cache_key)
+            return list(cached_articles)
+
+    def _store_articles(self, cache_key: Tuple[str, bool, int], articles: List[Article]):
+        """
+        記事情報をキャッシュに保存（上限を超えた場合は最も古いものを削除）
+
+        Args:
+            cache_key: キャッシュのキー
+            articles: 記事情報のリスト
+        """
+        with self._articles_cache_lock:
+            self._articles_cache[cache_key] = (time.monotonic(), tuple(articles))
+            self._articles_cache.move_to_end(cache_key)
+            if len(self._articles_cache) > ARTICLES_CACHE_SIZE:
+                self._articles_cache.popitem(last=False)
+
+    def _get_parsed_feed(self, feed_cache_key: Tuple[str, int], validator: Optional[str]) -> Optional[List[Article]]:
+        """
+        解析済みフィードのキャッシュから記事情報を取得（ETagまたはLast-Modifiedが一致する場合のみ）
+
+        Args:
+            feed_cache_key: キャッシュのキー
+            validator: レスポンスのETagまたはLast-Modified
+
+        Returns:
+            Optional[List[Article]]: 解析済みの記事情報、存在しないかフィードが更新されている場合はNone
+        """
+        if not validator:
+            return None
+
+        with self._feed_cache_lock:
+            cached_validator, cached_articles = self._feed_cache.get(feed_cache_key, (None, ()))
+            if validator != cached_validator:
+                return None
+
+            self._feed_cache.move_to_end(feed_cache_key)
+            return list(cached_articles)
+
+    def _store_parsed_feed(self, feed_cache_key: Tuple[str, int], validator: str, articles: List[Article]):
+        """
+        解析済みフィードをキャッシュに保存（上限を超えた場合は最も古いものを削除）
+
+        Args:
+            feed_cache_key: キャッシュのキー
+            validator: レスポンスのETagまたはLast-Modified
+            articles: 記事情報のリスト
+        """
+        with self._feed_cache_lock:
+            self._feed_cache[feed_cache_key] = (validator, tuple(articles))
+            self._feed_cache.move_to_end(feed_cache_key)
+            if len(self._feed_cache) > FEED_CACHE_SIZE:
+                self._feed_cache.popitem(last=False)
+
+    def _fetch_articles_from_feed(self, max_articles: int) -> List[Article]:
+        """
+        ZennのRSSフィードから記事情報を取得
+
+        Args:
+            max_articles: 取得する最大記事数
+
+        Returns:
+            List[Article]: 記事情報のリスト
         """
         if not self._validate_username():
             logger.error(f"無効なユーザー名です: {self.username}")
@@ -89,63 +372,90 @@ class ZennDataFetcher:
                 # フィードが取得できない場合は、従来のスクレイピング方法を試みる
                 return self._fetch_articles_by_scraping()
 
-            # XMLをパース
+            # フィードが前回解析したものと同じ（ETag/Last-Modifiedが一致）場合は解析を省略
+            # （期限切れのキャッシュの再検証はrequests-cacheが条件付きリクエストで行う）
+            feed_cache_key = (self.feed_url, max_articles)
+            validator = response.headers.get("ETag") or response.headers.get("Last-Modified")
+            cached_articles = self._get_parsed_feed(feed_cache_key, validator)
+            if cached_articles is not None:
+                logger.info(f"RSSフィードが更新されていないため、解析済みの記事を使用します: {self.feed_url}")
+                return cached_articles
+
+            # XMLをパース（<item>ごとに逐次処理し、処理済みの要素は破棄してメモリ使用量を抑える）
             try:
-                root = ET.fromstring(response.content)
-                # チャンネル情報を取得
-                channel = root.find(".//channel")
-                if channel is None:
+                channel_found = False
+                item_count = 0
+                context = etree.iterparse(
+                    io.BytesIO(response.content), events=("end",), tag=("channel", "item"), resolve_entities=False
+                )
+                for _, item in context:
+                    # チャンネル情報（全アイテムの後に閉じられる）
+                    if item.tag == "channel":
+                        channel_found = True
+                        continue
+
+                    # 記事アイテム
+                    item_count += 1
+                    if len(articles) < max_articles:
+                        try:
+                            # 子要素を一度だけ走査して必要な項目を取り出す（同じ項目が複数ある場合は最初のものを使用）
+                            fields = {}
+                            for child in item:
+                                if child.tag in _RSS_ITEM_FIELDS:
+                                    fields.setdefault(child.tag, child.text or "")
+
+                            # タイトル
+                            title = fields.get("title", "")
+
+                            # リンク
+                            url = fields.get("link", "")
+
+                            # 説明
+                            description = fields.get("description", "")
+
+                            # 公開日（ソート用の日時もここで解析しておく）
+                            published_at = fields.get("pubDate", "")
+                            pub_datetime = _parse_pub_date(published_at)
+
+                            # GUID
+                            guid = fields.get("guid", "")
+
+                            # いいね数（RSSフィードには含まれていないので0とする）
+                            likes = 0
+
+                            # タグ（RSSフィードには含まれていないので空リストとする）
+                            tags = []
+
+                            article_data = Article(
+                                title=title,
+                                url=url,
+                                likes=likes,
+                                published_at=published_at,
+                                description=description,
+                                tags=tags,
+                                guid=guid,
+                                pub_datetime=pub_datetime,
+                            )
+
+                            articles.append(article_data)
+                        except Exception as e:
+                            logger.error(f"記事アイテムの解析中にエラーが発生しました: {e}")
+
+                    # 処理済みのアイテムと、それより前の兄弟要素を破棄
+                    item.clear()
+                    while item.getprevious() is not None:
+                        del item.getparent()[0]
+
+                if not channel_found:
                     logger.warning("RSSフィードのチャンネル情報が見つかりませんでした")
                     return self._fetch_articles_by_scraping()
 
-                # 記事アイテムを取得
-                items = root.findall(".//item")
-                logger.info(f"RSSフィードから {len(items)} 個の記事が見つかりました")
-
-                for item in items[:max_articles]:
-                    try:
-                        # タイトル
-                        title_elem = item.find("title")
-                        title = title_elem.text if title_elem is not None else ""
-
-                        # リンク
-                        link_elem = item.find("link")
-                        url = link_elem.text if link_elem is not None else ""
-
-                        # 説明
-                        description_elem = item.find("description")
-                        description = description_elem.text if description_elem is not None else ""
-
-                        # 公開日
-                        pubdate_elem = item.find("pubDate")
-                        published_at = pubdate_elem.text if pubdate_elem is not None else ""
-
-                        # GUID
-                        guid_elem = item.find("guid")
-                        guid = guid_elem.text if guid_elem is not None else ""
+                logger.info(f"RSSフィードから {item_count} 個の記事が見つかりました")
 
-                        # いいね数（RSSフィードには含まれていないので0とする）
-                        likes = 0
+                if validator:
+                    self._store_parsed_feed(feed_cache_key, validator, articles)
 
-                        # タグ（RSSフィードには含まれていないので空リストとする）
-                        tags = []
-
-                        article_data = {
-                            "title": title,
-                            "url": url,
-                            "likes": likes,
-                            "published_at": published_at,
-                            "description": description,
-                            "tags": tags,
-                            "guid": guid,
-                        }
-
-                        articles.append(article_data)
-                    except Exception as e:
-                        logger.error(f"記事アイテムの解析中にエラーが発生しました: {e}")
-                        continue
-
-            except ET.ParseError as e:
+            except etree.XMLSyntaxError as e:
                 logger.error(f"XMLの解析中にエラーが発生しました: {e}")
                 # XMLの解析に失敗した場合は、従来のスクレイピング方法を試みる
                 return self._fetch_articles_by_scraping()
@@ -157,7 +467,7 @@ class ZennDataFetcher:
 
         return articles
 
-    def _fetch_articles_by_scraping(self, max_pages: int = 5) -> List[Dict[str, Any]]:
+    def _fetch_articles_by_scraping(self, max_pages: int = 5) -> List[Article]:
         """
         従来のスクレイピング方法でZennのアカウントページから記事情報を取得
 
@@ -165,7 +475,7 @@ class ZennDataFetcher:
             max_pages: 取得する最大ページ数（デフォルト: 5）
 
         Returns:
-            List[Dict[str, Any]]: 記事情報のリスト
+            List[Article]: 記事情報のリスト
         """
         logger.info("RSSフィードからの取得に失敗したため、スクレイピングで記事を取得します")
 
@@ -180,10 +490,10 @@ class ZennDataFetcher:
                     logger.warning(f"ページの取得に失敗しました: {page_url}, ステータスコード: {response.status_code}")
                     break
 
-                soup = BeautifulSoup(response.text, "html.parser")
+                doc = lxml.html.fromstring(response.content)
 
                 # デバッグ情報
-                logger.info(f"ページのタイトル: {soup.title.text if soup.title else 'タイトルなし'}")
+                logger.info(f"ページのタイトル: {doc.findtext('.//title') or 'タイトルなし'}")
                 logger.info(f"ページのURL: {page_url}")
 
                 # 記事要素を探すためのさまざまなセレクタを試す
@@ -200,16 +510,16 @@ class ZennDataFetcher:
 
                 article_elements = []
                 for selector in selectors:
-                    elements = soup.select(selector)
+                    elements = _select(doc, selector)
                     if elements:
-                        logger.info(f"セレクタ '{selector}' で {len(elements)} 個の要素が見つかりました")
+                        logger.info("セレクタ '%s' で %d 個の要素が見つかりました", selector, len(elements))
                         article_elements = elements
                         break
 
                 # 記事が見つからない場合は、リンクから記事を探す
                 if not article_elements:
                     logger.warning(f"ページ {page} で記事が見つかりませんでした。リンクから記事を探します。")
-                    article_links = soup.select("a[href*='/articles/']")
+                    article_links = _select(doc, "a[href*='/articles/']")
                     if article_links:
                         logger.info(f"{len(article_links)} 個の記事リンクが見つかりました")
                         # リンクから記事情報を抽出
@@ -220,8 +530,9 @@ class ZennDataFetcher:
                         break
                     else:
                         logger.warning("記事リンクも見つかりませんでした。HTMLの構造が変わった可能性があります。")
-                        # HTMLの一部をログに出力
-                        logger.debug(f"HTML: {soup.prettify()[:1000]}...")
+                        # HTMLの一部をログに出力（DOM全体の再シリアライズはDEBUG有効時のみ行う）
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("HTML: %s...", lxml.html.tostring(doc, encoding="unicode", pretty_print=True)[:1000])
                         break
 
                 for article in article_elements:
@@ -230,8 +541,8 @@ class ZennDataFetcher:
                         articles.append(article_data)
 
                 # 次のページがあるか確認
-                next_button = soup.select_one("button.PaginationButton_button__Rlh9n[aria-label='Next page']")
-                if not next_button or "disabled" in next_button.attrs:
+                next_button = _select_one(doc, "button.PaginationButton_button__Rlh9n[aria-label='Next page']")
+                if next_button is None or "disabled" in next_button.attrib:
                     break
 
                 page += 1
@@ -241,15 +552,15 @@ class ZennDataFetcher:
 
         return articles
 
-    def _parse_article_from_link(self, link_element) -> Optional[Dict[str, Any]]:
+    def _parse_article_from_link(self, link_element) -> Optional[Article]:
         """
         リンク要素から記事情報を抽出する
 
         Args:
-            link_element: BeautifulSoupのリンク要素
+            link_element: lxmlのリンク要素
 
         Returns:
-            Optional[Dict[str, Any]]: 記事情報の辞書、抽出に失敗した場合はNone
+            Optional[Article]: 記事情報、抽出に失敗した場合はNone
         """
         try:
             # リンクのhref属性から記事URLを取得
@@ -264,89 +575,84 @@ class ZennDataFetcher:
                 article_url = f"{self.base_url}{article_path}" if article_path else ""
 
             # タイトルを取得
-            title = link_element.text.strip()
+            title = link_element.text_content().strip()
             if not title:
                 # 子要素からタイトルを探す
-                title_element = link_element.select_one("h2, h3, h4, .title, .heading")
-                if title_element:
-                    title = title_element.text.strip()
+                title_element = _select_one(link_element, "h2, h3, h4, .title, .heading")
+                if title_element is not None:
+                    title = title_element.text_content().strip()
 
             # タイトルが見つからない場合はURLからタイトルを推測
             if not title:
-                title_match = re.search(r"/articles/([^/]+)$", article_path)
+                title_match = _SLUG_RE.search(article_path)
                 if title_match:
                     title = title_match.group(1).replace("-", " ").title()
 
             # 親要素からいいね数を探す
             likes = 0
-            parent = link_element.parent
-            if parent:
-                likes_element = parent.select_one("span:contains('Likes'), .likes, [data-test='likes-count']")
-                if likes_element:
-                    likes_text = likes_element.text.strip()
-                    likes_match = re.search(r"(\d+)", likes_text)
+            parent = link_element.getparent()
+            if parent is not None:
+                # いいね数を含む要素のうち、文書順で最初のもの
+                likes_elements = parent.xpath(f"{_LIKES_SPAN_XPATH} | {_compile_selector(_LIKES_CSS).path}")
+                likes_element = likes_elements[0] if likes_elements else None
+                if likes_element is not None:
+                    likes_text = likes_element.text_content().strip()
+                    likes_match = _DIGITS_RE.search(likes_text)
                     if likes_match:
                         likes = int(likes_match.group(1))
 
             # 親要素から公開日を探す
             published_at = ""
-            if parent:
-                date_element = parent.select_one("time, [datetime], .date")
-                if date_element:
-                    published_at = date_element.text.strip()
+            if parent is not None:
+                date_element = _select_one(parent, "time, [datetime], .date")
+                if date_element is not None:
+                    published_at = date_element.text_content().strip()
 
             # 親要素から概要を探す
             description = ""
-            if parent:
-                description_element = parent.select_one("p, .description, .summary")
-                if description_element and description_element != link_element:
-                    description = description_element.text.strip()
+            if parent is not None:
+                description_element = _select_one(parent, "p, .description, .summary")
+                if description_element is not None and description_element is not link_element:
+                    description = description_element.text_content().strip()
 
-            # 親要素からタグを探す
+            # 親要素からタグを探す（出現順を保ったまま重複を除く）
             tags = []
-            if parent:
-                tag_elements = parent.select("a[href*='/topics/'], .tag, .topic")
-                for tag in tag_elements:
-                    if tag != link_element:
-                        tag_text = tag.text.strip()
-                        if tag_text and tag_text not in tags:
-                            tags.append(tag_text)
-
-            return {
-                "title": title,
-                "url": article_url,
-                "likes": likes,
-                "published_at": published_at,
-                "description": description,
-                "tags": tags,
-            }
+            if parent is not None:
+                tag_elements = _select(parent, "a[href*='/topics/'], .tag, .topic")
+                tag_texts = (tag.text_content().strip() for tag in tag_elements if tag is not link_element)
+                tags = list(dict.fromkeys(tag_text for tag_text in tag_texts if tag_text))
+
+            return Article(
+                title=title,
+                url=article_url,
+                likes=likes,
+                published_at=published_at,
+                description=description,
+                tags=tags,
+            )
         except Exception as e:
             logger.error(f"リンクからの記事解析中にエラーが発生しました: {e}")
             return None
 
-    def _parse_article(self, article_element) -> Optional[Dict[str, Any]]:
+    def _parse_article(self, article_element) -> Optional[Article]:
         """
         記事要素から情報を抽出する
 
         Args:
-            article_element: BeautifulSoupの記事要素
+            article_element: lxmlの記事要素
 
         Returns:
-            Optional[Dict[str, Any]]: 記事情報の辞書、抽出に失敗した場合はNone
+            Optional[Article]: 記事情報、抽出に失敗した場合はNone
         """
         try:
             # タイトルと記事URLの取得（より汎用的なセレクタを使用）
-            title_element = (
-                article_element.select_one("h3 a")
-                or article_element.select_one("h2 a")
-                or article_element.select_one("a[href*='/articles/']")
-            )
+            title_element = _select_first(article_element, "h3 a", "h2 a", "a[href*='/articles/']")
 
-            if not title_element:
+            if title_element is None:
                 logger.warning("記事のタイトル要素が見つかりませんでした")
                 return None
 
-            title = title_element.text.strip()
+            title = title_element.text_content().strip()
             article_path = title_element.get("href", "")
             # 既に完全なURLの場合はそのまま使用
             if article_path.startswith("http"):
@@ -356,62 +662,53 @@ class ZennDataFetcher:
 
             # いいね数の取得（より汎用的なセレクタを使用）
             likes = 0
-            likes_element = (
-                article_element.select_one("[data-test='likes-count']")
-                or article_element.select_one("span:contains('Likes')")
-                or article_element.select_one("span.likes")
-                or article_element.select_one("div span")  # 最後の手段として一般的なspan要素を探す
-            )
+            likes_element = _select_one(article_element, "[data-test='likes-count']")
+            if likes_element is None:
+                likes_spans = article_element.xpath(_LIKES_SPAN_XPATH)
+                if likes_spans:
+                    likes_element = likes_spans[0]
+                else:
+                    # 最後の手段として一般的なspan要素を探す
+                    likes_element = _select_first(article_element, "span.likes", "div span")
 
-            if likes_element:
-                likes_text = likes_element.text.strip()
-                likes_match = re.search(r"(\d+)", likes_text)
+            if likes_element is not None:
+                likes_text = likes_element.text_content().strip()
+                likes_match = _DIGITS_RE.search(likes_text)
                 if likes_match:
                     likes = int(likes_match.group(1))
                 else:
                     logger.debug(f"いいね数のパターンが一致しませんでした: {likes_text}")
 
             # 公開日の取得（より汎用的なセレクタを使用）
-            date_element = (
-                article_element.select_one("time")
-                or article_element.select_one("[datetime]")
-                or article_element.select_one(".date")
-            )
-            published_at = date_element.text.strip() if date_element else ""
+            date_element = _select_first(article_element, "time", "[datetime]", ".date")
+            published_at = date_element.text_content().strip() if date_element is not None else ""
 
             # 概要の取得（より汎用的なセレクタを使用）
-            description_element = (
-                article_element.select_one("p")
-                or article_element.select_one(".description")
-                or article_element.select_one(".summary")
-            )
-            description = description_element.text.strip() if description_element else ""
+            description_element = _select_first(article_element, "p", ".description", ".summary")
+            description = description_element.text_content().strip() if description_element is not None else ""
 
-            # タグの取得（より汎用的なセレクタを使用）
-            tags = []
+            # タグの取得（より汎用的なセレクタを使用、出現順を保ったまま重複を除く）
             tag_elements = (
-                article_element.select("a[href*='/topics/']")
-                or article_element.select(".tag")
-                or article_element.select(".topic")
+                _select(article_element, "a[href*='/topics/']")
+                or _select(article_element, ".tag")
+                or _select(article_element, ".topic")
+            )
+            tag_texts = (tag.text_content().strip() for tag in tag_elements)
+            tags = list(dict.fromkeys(tag_text for tag_text in tag_texts if tag_text))
+
+            return Article(
+                title=title,
+                url=article_url,
+                likes=likes,
+                published_at=published_at,
+                description=description,
+                tags=tags,
             )
-            for tag in tag_elements:
-                tag_text = tag.text.strip()
-                if tag_text and tag_text not in tags:
-                    tags.append(tag_text)
-
-            return {
-                "title": title,
-                "url": article_url,
-                "likes": likes,
-                "published_at": published_at,
-                "description": description,
-                "tags": tags,
-            }
         except Exception as e:
             logger.error(f"記事の解析中にエラーが発生しました: {e}")
             return None
 
-    def get_popular_articles(self, limit: int = 5, random_seed: Optional[int] = None) -> List[Dict[str, Any]]:
+    def get_popular_articles(self, limit: int = 5, random_seed: Optional[int] = None) -> List[Article]:
         """
         人気記事を取得する
 
@@ -420,14 +717,12 @@ class ZennDataFetcher:
             random_seed: ランダムシードの値（Noneの場合は現在時刻を使用）
 
         Returns:
-            List[Dict[str, Any]]: 人気記事のリスト
+            List[Article]: 人気記事のリスト
         """
-        # ランダムモジュールはすでにインポート済み
-
-        # ランダムシードを設定
+        # ランダムシードを設定（グローバルな乱数状態を変更しないよう、呼び出しごとの乱数生成器を使う）
         if random_seed is None:
-            random_seed = int(datetime.now().timestamp())
-        random.seed(random_seed)
+            random_seed = time.time_ns()
+        rng = random.Random(random_seed)
 
         articles = self.fetch_articles()
 
@@ -435,39 +730,11 @@ class ZennDataFetcher:
             logger.warning("記事が見つかりませんでした")
             return []
 
-        # RSSフィードから取得した場合、いいね数の情報がないため、公開日でソート
-        # 公開日の形式を解析してdatetimeオブジェクトに変換
-        for article in articles:
-            try:
-                pub_date = article.get("published_at", "")
-                if pub_date:
-                    # RFC 822形式の日付を解析
-                    try:
-                        from email.utils import parsedate_to_datetime
-
-                        dt = parsedate_to_datetime(pub_date)
-                        article["pub_datetime"] = dt
-                    except Exception:
-                        # 他の形式の日付を試す
-                        try:
-                            dt = datetime.strptime(pub_date, "%a, %d %b %Y %H:%M:%S %Z")
-                            article["pub_datetime"] = dt
-                        except Exception:
-                            # 日付の解析に失敗した場合は現在時刻を使用
-                            article["pub_datetime"] = datetime.now()
-                else:
-                    article["pub_datetime"] = datetime.now()
-            except Exception as e:
-                logger.error(f"公開日の解析中にエラーが発生しました: {e}")
-                article["pub_datetime"] = datetime.now()
-
-        # 公開日でソート（新しい順）
-        sorted_articles = sorted(articles, key=lambda x: x.get("pub_datetime", datetime.now()), reverse=True)
-
-        # 上位20件からランダムに選択
-        top_articles = sorted_articles[:20]
+        # RSSフィードから取得した場合、いいね数の情報がないため、公開日が新しい上位20件からランダムに選択
+        # （公開日は取得時に解析済み。全件をソートせずに上位だけを取り出す）
+        top_articles = heapq.nlargest(20, articles, key=attrgetter("pub_datetime"))
         if len(top_articles) > limit:
-            selected_articles = random.sample(top_articles, limit)
+            selected_articles = rng.sample(top_articles, limit)
         else:
             selected_articles = top_articles
 
@@ -0,0 +1,66 @@
+import pytest
+
+from src.gradio_interface import GradioInterface
+from src.post_generator import PostGenerator
+
+
+@pytest.fixture
+def interface():
+    return GradioInterface(generator=PostGenerator(api_key="test-key"))
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        # 通常のZenn URL
+        ("https://zenn.dev/karaage0703", ("karaage0703", False)),
+        ("http://zenn.dev/karaage0703", ("karaage0703", False)),
+        ("https://zenn.dev/karaage0703/articles/abc123", ("karaage0703", False)),
+        ("https://zenn.dev/user_name-1/", ("user_name-1", False)),
+        # 企業アカウントのURL
+        ("https://zenn.dev/p/company", ("company", True)),
+        ("http://zenn.dev/p/company", ("company", True)),
+        ("https://zenn.dev/p/company/articles", ("company", True)),
+        # p/の後にユーザー名がない場合は、pという通常のユーザー名として扱う
+        ("https://zenn.dev/p/", ("p", False)),
+        # @username形式
+        ("@karaage0703", ("karaage0703", False)),
+        ("@karaage0703/articles", ("karaage0703", False)),
+        ("フォローしてください @karaage0703", ("karaage0703", False)),
+        ("https://zenn.dev/@karaage0703", ("karaage0703", False)),
+        # ユーザー名のみ
+        ("karaage0703", ("karaage0703", False)),
+        ("user_name-1", ("user_name-1", False)),
+        # 末尾の改行1つは無視する
+        ("https://zenn.dev/karaage0703\n", ("karaage0703", False)),
+        ("https://zenn.dev/karaage0703/articles\n", ("karaage0703", False)),
+        ("https://zenn.dev/p/company\n", ("company", True)),
+        ("karaage0703\n", ("karaage0703", False)),
+        # 文字列中のURLは条件を満たす最初のものを使う
+        ("https://zenn.dev/https://zenn.dev/karaage0703", ("karaage0703", False)),
+        ("http://zenn.dev/p/?https://zenn.dev/p/company", ("company", True)),
+    ],
+)
+def test_extract_username(interface, url, expected):
+    assert interface.extract_username(url) == expected
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "",
+        "@",
+        "user name",
+        "user!",
+        "ユーザー",
+        # スキームのないURLはユーザー名として扱わない
+        "zenn.dev/karaage0703",
+        "https://zenn.dev/",
+        "https://example.com/karaage0703",
+        "https://zenn.dev/karaage0703?tab=articles",
+        "karaage0703\n\n",
+        "https://zenn.dev/karaage0703/\nfoo",
+    ],
+)
+def test_extract_username_invalid(interface, url):
+    assert interface.extract_username(url) is None
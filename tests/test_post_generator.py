@@ -0,0 +1,139 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import src.post_generator as post_generator
+from src.post_generator import COMPLETION_CACHE_TTL, PostGenerator
+from src.zenn_data_fetcher import Article
+
+ARTICLES = [
+    Article(title="記事1", url="https://zenn.dev/user/articles/1", likes=3, published_at="", description="概要1", tags=[]),
+    Article(title="記事2", url="https://zenn.dev/user/articles/2", likes=10, published_at="", description="概要2", tags=[]),
+]
+
+
+class FakeCompletions:
+    """呼び出しごとに異なる投稿文を返すchat.completions"""
+
+    def __init__(self):
+        self.calls = []
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        message = SimpleNamespace(content=f"投稿{len(self.calls)}")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(post_generator, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+@pytest.fixture
+def generator():
+    generator = PostGenerator(api_key="test-key")
+    generator._client = SimpleNamespace(chat=SimpleNamespace(completions=FakeCompletions()))
+    return generator
+
+
+def test_generate_post_reuses_recent_completion(generator, clock):
+    assert generator.generate_post(ARTICLES) == "投稿1"
+    clock[0] += COMPLETION_CACHE_TTL - 1
+    assert generator.generate_post(ARTICLES) == "投稿1"
+    assert len(generator._client.chat.completions.calls) == 1
+
+
+def test_generate_post_regenerates_after_ttl(generator, clock):
+    assert generator.generate_post(ARTICLES) == "投稿1"
+    clock[0] += COMPLETION_CACHE_TTL
+    assert generator.generate_post(ARTICLES) == "投稿2"
+    assert len(generator._client.chat.completions.calls) == 2
+
+
+def test_template_url_is_most_liked_article(generator):
+    post = generator.generate_post(ARTICLES, template="定型文 {url}")
+    assert post == f"定型文 {ARTICLES[1].url}\n\n投稿1"
+
+    # プロンプトでも同じ記事を最も人気の記事として記載する
+    user_prompt = generator._client.chat.completions.calls[0]["messages"][1]["content"]
+    assert f"1. タイトル: {ARTICLES[1].title}\n   URL: {ARTICLES[1].url}" in user_prompt
+
+
+def _chunk(content):
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content))])
+
+
+class FakeStreamingCompletions:
+    """ストリーミングで決まったチャンクを返すchat.completions"""
+
+    def __init__(self, contents):
+        self.contents = contents
+        self.calls = []
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        return [_chunk(content) for content in self.contents]
+
+
+class FakeAsyncStreamingCompletions(FakeStreamingCompletions):
+    """非同期ストリーミングで決まったチャンクを返すchat.completions"""
+
+    async def create(self, **kwargs):
+        chunks = super().create(**kwargs)
+
+        async def stream():
+            for chunk in chunks:
+                yield chunk
+
+        return stream()
+
+
+def _collect_async(agen):
+    async def collect():
+        return [text async for text in agen]
+
+    return asyncio.run(collect())
+
+
+@pytest.fixture
+def streaming_generator():
+    generator = PostGenerator(api_key="test-key")
+    completions = FakeStreamingCompletions([None, "こんにちは", "", "世界"])
+    async_completions = FakeAsyncStreamingCompletions([None, "こんにちは", "", "世界"])
+    generator._client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    generator._aclient = SimpleNamespace(chat=SimpleNamespace(completions=async_completions))
+    return generator
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_streaming_generates_and_caches(streaming_generator, use_async):
+    def run():
+        if use_async:
+            return _collect_async(streaming_generator.generate_post_astreaming(ARTICLES, template="定型文 {url}"))
+        return list(streaming_generator.generate_post_streaming(ARTICLES, template="定型文 {url}"))
+
+    head = f"定型文 {ARTICLES[1].url}\n\n"
+    assert run() == [head, "こんにちは", "世界"]
+
+    # 2回目はAPIを呼ばずにキャッシュを返す
+    assert run() == [head, "こんにちは世界"]
+    completions = streaming_generator._aclient if use_async else streaming_generator._client
+    assert len(completions.chat.completions.calls) == 1
+    assert completions.chat.completions.calls[0]["stream"] is True
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_streaming_input_errors(use_async):
+    def run(generator, articles):
+        if use_async:
+            return _collect_async(generator.generate_post_astreaming(articles))
+        return list(generator.generate_post_streaming(articles))
+
+    assert run(PostGenerator(api_key="test-key"), []) == ["記事が見つかりませんでした。"]
+
+    no_key_generator = PostGenerator(api_key="test-key")
+    no_key_generator.api_key = None
+    assert run(no_key_generator, ARTICLES) == ["OpenAI APIキーが設定されていないため、投稿文を生成できません。"]
@@ -0,0 +1,206 @@
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import lxml.html
+import pytest
+
+import src.zenn_data_fetcher as zenn_data_fetcher
+from src.zenn_data_fetcher import MIN_PUB_DATETIME, ZennDataFetcher, _parse_pub_date
+
+FEED_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+  <channel>
+    <title>karaage0703さんのフィード</title>
+    <link>https://zenn.dev/karaage0703</link>
+    <item>
+      <title>記事1</title>
+      <link>https://zenn.dev/karaage0703/articles/first</link>
+      <description>概要1</description>
+      <pubDate>Mon, 01 Jan 2024 12:00:00 GMT</pubDate>
+      <guid>https://zenn.dev/karaage0703/articles/first</guid>
+    </item>
+    <item>
+      <!-- コメントは無視される -->
+      <title>記事2</title>
+      <title>重複したタイトル</title>
+      <link>https://zenn.dev/karaage0703/articles/second</link>
+      <pubDate>invalid</pubDate>
+    </item>
+  </channel>
+</rss>
+""".encode()
+
+
+class FakeSession:
+    """指定したレスポンスを返すHTTPセッション"""
+
+    def __init__(self, content, status_code=200, headers=None):
+        self.response = SimpleNamespace(content=content, status_code=status_code, headers=headers or {})
+        self.requested_urls = []
+
+    def get(self, url):
+        self.requested_urls.append(url)
+        return self.response
+
+
+@pytest.fixture
+def make_fetcher(monkeypatch):
+    def _make_fetcher(content, **kwargs):
+        monkeypatch.setattr(zenn_data_fetcher, "_shared_session", FakeSession(content, **kwargs))
+        monkeypatch.setattr(ZennDataFetcher, "_articles_cache", OrderedDict())
+        return ZennDataFetcher("karaage0703")
+
+    return _make_fetcher
+
+
+def test_parse_pub_date_rfc822():
+    assert _parse_pub_date("Mon, 01 Jan 2024 12:00:00 GMT") == datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def test_parse_pub_date_keeps_offset():
+    pub_datetime = _parse_pub_date("Mon, 01 Jan 2024 21:00:00 +0900")
+    assert pub_datetime.utcoffset() == timedelta(hours=9)
+    assert pub_datetime == datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def test_parse_pub_date_naive_is_utc():
+    # -0000はタイムゾーン不明として扱われるため、UTCとみなして比較できるようにする
+    pub_datetime = _parse_pub_date("Mon, 01 Jan 2024 12:00:00 -0000")
+    assert pub_datetime.tzinfo is not None
+    assert pub_datetime == datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize("pub_date", ["", "not a date", "2024-01-01"])
+def test_parse_pub_date_invalid(pub_date):
+    assert _parse_pub_date(pub_date) == MIN_PUB_DATETIME
+
+
+def test_fetch_articles_parses_feed(make_fetcher):
+    fetcher = make_fetcher(FEED_XML)
+    articles = fetcher.fetch_articles()
+
+    assert fetcher.session.requested_urls == ["https://zenn.dev/karaage0703/feed"]
+    assert len(articles) == 2
+
+    first, second = articles
+    assert first.title == "記事1"
+    assert first.url == "https://zenn.dev/karaage0703/articles/first"
+    assert first.description == "概要1"
+    assert first.published_at == "Mon, 01 Jan 2024 12:00:00 GMT"
+    assert first.pub_datetime == datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+    assert first.guid == "https://zenn.dev/karaage0703/articles/first"
+    assert first.likes == 0
+    assert first.tags == []
+
+    # 同じ項目が複数ある場合は最初のものを使用し、ない項目は空文字列とする
+    assert second.title == "記事2"
+    assert second.description == ""
+    assert second.guid == ""
+    assert second.pub_datetime == MIN_PUB_DATETIME
+
+
+def test_fetch_articles_max_articles(make_fetcher):
+    articles = make_fetcher(FEED_XML).fetch_articles(max_articles=1)
+    assert [article.title for article in articles] == ["記事1"]
+
+
+def test_fetch_articles_reuses_parsed_feed_with_same_etag(make_fetcher):
+    fetcher = make_fetcher(FEED_XML, headers={"ETag": "abc"})
+    articles = fetcher._fetch_articles_from_feed(100)
+
+    # 同じETagのレスポンスは解析せずに前回の結果を返す
+    fetcher.session.response.content = b"<rss><channel></channel></rss>"
+    assert fetcher._fetch_articles_from_feed(100) == articles
+
+    # ETagが変わった場合は解析し直す
+    fetcher.session.response.headers["ETag"] = "def"
+    assert fetcher._fetch_articles_from_feed(100) == []
+
+
+def test_feed_cache_is_bounded(make_fetcher):
+    fetcher = make_fetcher(FEED_XML, headers={"ETag": "abc"})
+    for i in range(zenn_data_fetcher.FEED_CACHE_SIZE + 1):
+        fetcher.username = f"user{i}"
+        fetcher.setup_urls()
+        fetcher._fetch_articles_from_feed(100)
+    assert len(fetcher._feed_cache) == zenn_data_fetcher.FEED_CACHE_SIZE
+    assert ("https://zenn.dev/user0/feed", 100) not in fetcher._feed_cache
+
+
+@pytest.mark.parametrize("content", [b"<rss><channel>", b"<html><body></body></html>"])
+def test_fetch_articles_falls_back_to_scraping(make_fetcher, monkeypatch, content):
+    fetcher = make_fetcher(content)
+    monkeypatch.setattr(fetcher, "_fetch_articles_by_scraping", lambda: ["scraped"])
+    assert fetcher.fetch_articles() == ["scraped"]
+
+
+SCRAPED_PAGE_HTML = "".join(
+    [
+        "<html><head><meta charset='utf-8'><title>karaage0703の記事</title></head><body>",
+        *(
+            f"<article>"
+            f"<h2><a href='/karaage0703/articles/slug{i}'>記事{i}</a></h2>"
+            f"<span>{i * 10} Likes</span>"
+            f"<time>2024-01-0{i}</time>"
+            f"<p>概要{i}</p>"
+            f"<a href='/topics/python'>Python</a><a href='/topics/python'>Python</a>"
+            f"</article>"
+            for i in range(1, 7)
+        ),
+        "</body></html>",
+    ]
+).encode()
+
+
+def test_fetch_articles_by_scraping_parses_every_card_repeatedly(make_fetcher):
+    fetcher = make_fetcher(SCRAPED_PAGE_HTML)
+
+    # コンパイル済みのセレクタを使い回しても、同じページを何度でも解析できる
+    for _ in range(2):
+        articles = fetcher._fetch_articles_by_scraping()
+        assert [article.title for article in articles] == [f"記事{i}" for i in range(1, 7)]
+        assert [article.likes for article in articles] == [i * 10 for i in range(1, 7)]
+        assert articles[0].url == "https://zenn.dev/karaage0703/articles/slug1"
+        assert articles[0].published_at == "2024-01-01"
+        assert articles[0].description == "概要1"
+        assert articles[0].tags == ["Python"]
+
+
+def test_parse_article_from_link_repeatedly(make_fetcher):
+    fetcher = make_fetcher(b"")
+    html = "".join(
+        f"<div><a href='/karaage0703/articles/slug{i}'>記事{i}</a><span>{i} Likes</span><time>2024-01-0{i}</time></div>"
+        for i in range(1, 7)
+    )
+
+    # コンパイル済みのセレクタを使い回しても、別の文書のリンクを何度でも解析できる
+    for _ in range(2):
+        doc = lxml.html.fromstring(f"<html><body>{html}</body></html>")
+        articles = [fetcher._parse_article_from_link(link) for link in doc.xpath("//a")]
+        assert [article.title for article in articles] == [f"記事{i}" for i in range(1, 7)]
+        assert [article.likes for article in articles] == list(range(1, 7))
+        assert articles[0].url == "https://zenn.dev/karaage0703/articles/slug1"
+        assert articles[0].published_at == "2024-01-01"
+
+
+def test_fetch_articles_cache_expires_and_is_bounded(make_fetcher, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(zenn_data_fetcher.time, "monotonic", lambda: now[0])
+    fetcher = make_fetcher(FEED_XML)
+
+    # TTL内は再取得せず、TTLを過ぎたら再取得する
+    fetcher.fetch_articles()
+    fetcher.fetch_articles()
+    assert len(fetcher.session.requested_urls) == 1
+    now[0] += zenn_data_fetcher.ARTICLES_CACHE_TTL
+    fetcher.fetch_articles()
+    assert len(fetcher.session.requested_urls) == 2
+
+    # 上限を超えたアカウントは古いものから破棄する
+    for i in range(zenn_data_fetcher.ARTICLES_CACHE_SIZE + 1):
+        fetcher.username = f"user{i}"
+        fetcher.setup_urls()
+        fetcher.fetch_articles()
+    assert len(ZennDataFetcher._articles_cache) == zenn_data_fetcher.ARTICLES_CACHE_SIZE
+    assert ("user0", False, 100) not in ZennDataFetcher._articles_cache